@@ -1,9 +1,11 @@
 __version__ = "0.0.8"
 
-from cryoet_alignment.api.read import read
-from cryoet_alignment.api.write import write
+from cryoet_alignment.api.read import read, read_many
+from cryoet_alignment.api.write import write, write_many
 
 __all__ = [
     "read",
+    "read_many",
     "write",
+    "write_many",
 ]
@@ -1,5 +1,7 @@
 import os
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, Union
 
 from cryoet_alignment.io.aretomo3 import AreTomo3ALN
 from cryoet_alignment.io.cryoet_data_portal import Alignment
@@ -72,7 +74,7 @@ def read_cdp(cdp_path: PATH_TYPE) -> Alignment:
     Returns:
         Alignment: The alignment object.
     """
-    return Alignment.from_cdp(cdp_path)
+    return Alignment.from_file(cdp_path)
 
 
 READER = {
@@ -82,8 +84,8 @@ READER = {
 }
 
 INFER_READER = {
-    ".aln": "aretomo3",
-    ".json": "cdp",
+    "aln": "aretomo3",
+    "json": "cdp",
 }
 
 
@@ -99,7 +101,27 @@ def read(path: PATH_TYPE, reader: str = None) -> Union[AreTomo3ALN, Alignment, I
         Union[AreTomo3ALN, Alignment, ImodAlignment]: The alignment object.
     """
     if reader is None:
-        _, ext = os.path.splitext(path)
+        ext = os.fsdecode(path).rpartition(".")[2].lower()
         reader = INFER_READER.get(ext, "imod")
 
     return READER[reader](path)
+
+
+def read_many(
+    paths: Iterable[PATH_TYPE],
+    reader: str = None,
+    max_workers: Optional[int] = None,
+) -> List[Union[AreTomo3ALN, Alignment, ImodAlignment]]:
+    """Read many alignment files concurrently. See `read` for details on the supported formats.
+
+    Args:
+        paths: The paths to the alignment files (or basenames for IMOD).
+        reader: The reader to use for all alignment files (one of "imod", "aretomo3" or "cdp"). If None, the reader
+        will be inferred from the file extension of each path.
+        max_workers: The maximum number of threads to use. If None, the default of `ThreadPoolExecutor` is used.
+
+    Returns:
+        List[Union[AreTomo3ALN, Alignment, ImodAlignment]]: The alignment objects, in the order of `paths`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(read, reader=reader), paths))
@@ -1,5 +1,7 @@
 import os
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Optional, Tuple, Union
 
 from cryoet_alignment.io.aretomo3 import AreTomo3ALN
 from cryoet_alignment.io.cryoet_data_portal import Alignment
@@ -57,8 +59,7 @@ def write_aretomo3(aln: AreTomo3ALN, aln_path: PATH_TYPE) -> None:
         aln: The alignment object to write.
         aln_path: The path to write the alignment file to.
     """
-    with open(aln_path, "w") as f:
-        f.write(str(aln))
+    aln.to_file(aln_path)
 
 
 def write_cdp(ali: Alignment, cdp_path: PATH_TYPE) -> None:
@@ -68,8 +69,7 @@ def write_cdp(ali: Alignment, cdp_path: PATH_TYPE) -> None:
         ali: The alignment object to write.
         cdp_path: The path to write the alignment file to.
     """
-    with open(cdp_path, "w") as f:
-        f.write(str(ali))
+    ali.to_file(cdp_path)
 
 
 WRITER = {
@@ -78,11 +78,16 @@ WRITER = {
     "cdp": write_cdp,
 }
 
-INFER_WRITER = {
-    Alignment: "cdp",
-    AreTomo3ALN: "aretomo3",
-    ImodAlignment: "imod",
-}
+
+def _infer_writer(alignment: Union[Alignment, AreTomo3ALN, ImodAlignment]) -> str:
+    if isinstance(alignment, Alignment):
+        return "cdp"
+    elif isinstance(alignment, AreTomo3ALN):
+        return "aretomo3"
+    elif isinstance(alignment, ImodAlignment):
+        return "imod"
+    else:
+        raise ValueError("Invalid alignment type. Must be Alignment, AreTomo3ALN or ImodAlignment")
 
 
 def write(alignment: Union[Alignment, AreTomo3ALN, ImodAlignment], path: PATH_TYPE, writer: str = None) -> None:
@@ -95,6 +100,26 @@ def write(alignment: Union[Alignment, AreTomo3ALN, ImodAlignment], path: PATH_TY
         be inferred from the alignment object type.
     """
     if writer is None:
-        writer = INFER_WRITER[type(alignment)]
+        writer = _infer_writer(alignment)
 
     WRITER[writer](alignment, path)
+
+
+def write_many(
+    items: Iterable[Tuple[Union[Alignment, AreTomo3ALN, ImodAlignment], PATH_TYPE]],
+    writer: str = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Write many alignments concurrently. See `write` for details on the supported formats.
+
+    Args:
+        items: Pairs of alignment objects and the paths to write them to.
+        writer: The writer to use for all alignments (one of "imod", "aretomo3" or "cdp"). If None, the writer will be
+        inferred from the type of each alignment object.
+        max_workers: The maximum number of threads to use. If None, the default of `ThreadPoolExecutor` is used.
+    """
+    # Transpose the pairs into one iterable of alignments and one of paths
+    columns = zip(*items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results to re-raise any exception from the workers
+        list(executor.map(partial(write, writer=writer), *columns))
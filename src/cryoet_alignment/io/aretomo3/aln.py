@@ -1,10 +1,21 @@
-from typing import List, Optional, Tuple, Union
+import functools
+import io
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
-import pandas as pd
-from pydantic import BaseModel
+import numpy.lib.recfunctions as rfn
+from pydantic import BaseModel, ConfigDict, PrivateAttr, computed_field
 
-from cryoet_alignment.io.base import FileIOBase
+from cryoet_alignment.io.base import BufferType, FileIOBase
+from cryoet_alignment.util.dataframe import is_dataframe
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Fixed-width row formats of the global and local alignment tables
+_GLOBAL_FMT = "%5d%11.4f%11.5f%11.3f%11.3f%9.2f%9.2f%9.2f%9.2f%10.2f"
+_LOCAL_FMT = "%4d%4d%9.2f%10.2f%10.2f%10.2f%6.1f"
+_DARK_FRAME_FMT = "# DarkFrame =%6d%5d%9.2f"
 
 
 class GlobalAlignmentInfo(BaseModel):
@@ -23,6 +34,8 @@ class GlobalAlignmentInfo(BaseModel):
         tilt (float): Tilt angle in degrees.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     sec: int
     rot: float
     gmag: float = 1.0
@@ -47,7 +60,19 @@ class GlobalAlignmentInfo(BaseModel):
         scale = float(values[7])
         base = float(values[8])
         tilt = float(values[9])
-        return cls(sec=sec, rot=rot, gmag=gmag, tx=tx, ty=ty, smean=smean, sfit=sfit, scale=scale, base=base, tilt=tilt)
+        # Values are already cast, skip validation
+        return cls.model_construct(
+            sec=sec,
+            rot=rot,
+            gmag=gmag,
+            tx=tx,
+            ty=ty,
+            smean=smean,
+            sfit=sfit,
+            scale=scale,
+            base=base,
+            tilt=tilt,
+        )
 
     def __iter__(self):
         return iter(
@@ -55,18 +80,7 @@ class GlobalAlignmentInfo(BaseModel):
         )
 
     def __str__(self):
-        return (
-            f"{self.sec:>5}"
-            f"{self.rot:>11.4f}"
-            f"{self.gmag:>11.5f}"
-            f"{self.tx:>11.3f}"
-            f"{self.ty:>11.3f}"
-            f"{self.smean:>9.2f}"
-            f"{self.sfit:>9.2f}"
-            f"{self.scale:>9.2f}"
-            f"{self.base:>9.2f}"
-            f"{self.tilt:>10.2f}"
-        )
+        return _GLOBAL_FMT % tuple(self)
 
 
 class DarkFrameInfo(BaseModel):
@@ -78,6 +92,8 @@ class DarkFrameInfo(BaseModel):
         angle (float): Tilt angle in degrees.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     section_idx: int
     val2: int
     angle: float
@@ -89,13 +105,14 @@ class DarkFrameInfo(BaseModel):
         section_idx = int(values[0])
         val2 = int(values[1])
         angle = float(values[2])
-        return cls(section_idx=section_idx, val2=val2, angle=angle)
+        # Values are already cast, skip validation
+        return cls.model_construct(section_idx=section_idx, val2=val2, angle=angle)
 
     def __iter__(self):
         return iter([self.section_idx, self.val2, self.angle])
 
     def __str__(self):
-        return f"# DarkFrame ={self.section_idx:>6}{self.val2:>5}{self.angle:>9.2f}"
+        return _DARK_FRAME_FMT % tuple(self)
 
 
 class LocalAlignmentInfo(BaseModel):
@@ -112,6 +129,8 @@ class LocalAlignmentInfo(BaseModel):
         is_reliable (float): reliable/unrelaible flag
     """
 
+    model_config = ConfigDict(frozen=True)
+
     sec_idx: int
     patch_idx: int
     center_x: float
@@ -130,7 +149,8 @@ class LocalAlignmentInfo(BaseModel):
         shift_x = float(values[4])
         shift_y = float(values[5])
         is_reliable = float(values[6])
-        return cls(
+        # Values are already cast, skip validation
+        return cls.model_construct(
             sec_idx=sec_idx,
             patch_idx=patch_idx,
             center_x=center_x,
@@ -154,21 +174,115 @@ class LocalAlignmentInfo(BaseModel):
         )
 
     def __str__(self):
-        return (
-            f"{self.sec_idx:>4}"
-            f"{self.patch_idx:>4}"
-            f"{self.center_x:>9.2f}"
-            f"{self.center_y:>10.2f}"
-            f"{self.shift_x:>10.2f}"
-            f"{self.shift_y:>10.2f}"
-            f"{self.is_reliable:>6.1f}"
-        )
+        return _LOCAL_FMT % tuple(self)
+
+
+_GLOBAL_DTYPE = np.dtype(
+    [
+        ("sec", "i8"),
+        ("rot", "f8"),
+        ("gmag", "f8"),
+        ("tx", "f8"),
+        ("ty", "f8"),
+        ("smean", "f8"),
+        ("sfit", "f8"),
+        ("scale", "f8"),
+        ("base", "f8"),
+        ("tilt", "f8"),
+    ],
+)
+
+_LOCAL_DTYPE = np.dtype(
+    [
+        ("sec_idx", "i8"),
+        ("patch_idx", "i8"),
+        ("center_x", "f8"),
+        ("center_y", "f8"),
+        ("shift_x", "f8"),
+        ("shift_y", "f8"),
+        ("is_reliable", "f8"),
+    ],
+)
+
+
+def _models_from_records(cls: Type[BaseModel], records: np.ndarray) -> List[BaseModel]:
+    """Materialize the rows of a structured alignment array as (unvalidated) pydantic models."""
+    names = records.dtype.names
+    return [cls.model_construct(**dict(zip(names, row))) for row in records.tolist()]
+
+
+def _records_from_values(cls: Type[BaseModel], dtype: np.dtype, values: Union[Sequence[Any], np.ndarray]) -> np.ndarray:
+    """Convert a sequence of pydantic models (or dicts) or an array to a structured alignment array.
+
+    Arrays are always copied, so later changes to `values` don't affect the stored alignment. Structured arrays are
+    matched to the fields by name, plain (N, num_fields) arrays by column. Integer fields must hold integral values.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype == dtype:
+            return np.array(values).reshape(-1)
+
+        if values.dtype.names is not None:
+            missing = [name for name in dtype.names if name not in values.dtype.names]
+            if missing:
+                raise ValueError(f"Alignment array is missing the fields {missing}.")
+            columns = [values[name].reshape(-1) for name in dtype.names]
+        elif values.ndim == 2 and values.shape[1] == len(dtype.names):
+            columns = list(values.T)
+        else:
+            raise ValueError(f"Alignment array must have shape (N, {len(dtype.names)}), got {values.shape}.")
+
+        records = np.empty(len(columns[0]), dtype=dtype)
+        for name, column in zip(dtype.names, columns):
+            # Casting to an integer field truncates, reject fractional (or NaN) indices like model validation does
+            if dtype[name].kind == "i" and column.dtype.kind == "f" and not np.all(np.mod(column, 1) == 0):
+                raise ValueError(f"Alignment field '{name}' must hold integer values.")
+            records[name] = column
+        return records
+
+    rows = [tuple(v if isinstance(v, cls) else cls.model_validate(v)) for v in values]
+    return np.array(rows, dtype=dtype)
+
+
+# Converters for the "# Key = value" header lines, keyed on the first word after "# "
+_HEADER_FIELDS = {
+    b"RawSize": ("RawSize", lambda value: tuple(map(int, value.split()))),
+    b"NumPatches": ("NumPatches", int),
+    b"AlphaOffset": ("AlphaOffset", float),
+    b"BetaOffset": ("BetaOffset", float),
+}
+
+
+def _next_line(data: BufferType, pos: int) -> int:
+    """Return the offset of the line following the one containing `pos`."""
+    eol = data.find(b"\n", pos)
+    return len(data) if eol == -1 else eol + 1
+
+
+# Parsers specialized on the fixed table schemas
+_parse_globals = functools.partial(np.loadtxt, dtype=_GLOBAL_DTYPE, ndmin=1)
+_parse_locals = functools.partial(np.loadtxt, dtype=_LOCAL_DTYPE, ndmin=1)
+
+
+def _parse_block(block: bytes, parser: functools.partial) -> np.ndarray:
+    """Parse a block of whitespace-separated rows into a structured array."""
+    if not block.strip():
+        return np.empty(0, dtype=parser.keywords["dtype"])
+    return parser(io.BytesIO(block))
 
 
 class AreTomo3ALN(FileIOBase):
     """AreTomo3's alignment file format (.aln). This file contains the global and local alignment information for a
     tilt series.
 
+    The global and local alignments are stored as numpy structured arrays internally (one field per column). Accessing
+    `GlobalAlignments` or `LocalAlignments` returns a freshly materialized list of models, i.e. modifying these list
+    entries has no effect on the stored alignment. Use the setters (or `set_global_alignments`/`set_local_alignments`)
+    instead. Arrays passed to the setters are copied.
+
+    By default, the local alignment table is parsed on first access, so a malformed local table only raises then (e.g.
+    when accessing `LocalAlignments`, serializing or comparing). Pass `load_locals=True` to `from_file`/`from_bytes`
+    (or `parser_kwargs={"load_locals": True}` to `from_s3`/`from_fs`) to parse and validate it immediately.
+
     Some rules (not enforced in the class yet):
     - The header must be "# AreTomo Alignment"
     - RawSize[2] == len(DarkFrames) + len(GlobalAlignments)
@@ -191,70 +305,129 @@ class AreTomo3ALN(FileIOBase):
     DarkFrames: List[DarkFrameInfo]
     AlphaOffset: float
     BetaOffset: float
-    GlobalAlignments: List[GlobalAlignmentInfo]
-    LocalAlignments: Optional[List[LocalAlignmentInfo]] = None
+
+    _globals: np.ndarray = PrivateAttr(default_factory=lambda: np.empty(0, dtype=_GLOBAL_DTYPE))
+    _locals: Optional[np.ndarray] = PrivateAttr(default=None)
+    # Unparsed local alignment table, parsed on first access
+    _local_block: Optional[bytes] = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        GlobalAlignments: Optional[Union[Sequence[GlobalAlignmentInfo], np.ndarray]] = None,  # noqa: N803
+        LocalAlignments: Optional[Union[Sequence[LocalAlignmentInfo], np.ndarray]] = None,  # noqa: N803
+        **data: Any,
+    ):
+        super().__init__(**data)
+        if GlobalAlignments is not None:
+            self.GlobalAlignments = GlobalAlignments
+        self.LocalAlignments = LocalAlignments
+
+    @computed_field
+    @property
+    def GlobalAlignments(self) -> List[GlobalAlignmentInfo]:
+        return _models_from_records(GlobalAlignmentInfo, self._globals)
+
+    @GlobalAlignments.setter
+    def GlobalAlignments(self, values: Union[Sequence[GlobalAlignmentInfo], np.ndarray]) -> None:
+        self._globals = _records_from_values(GlobalAlignmentInfo, _GLOBAL_DTYPE, values)
+
+    @computed_field
+    @property
+    def LocalAlignments(self) -> Optional[List[LocalAlignmentInfo]]:
+        records = self._local_records()
+        if records is None:
+            return None
+        return _models_from_records(LocalAlignmentInfo, records)
+
+    @LocalAlignments.setter
+    def LocalAlignments(self, values: Optional[Union[Sequence[LocalAlignmentInfo], np.ndarray]]) -> None:
+        self._locals = None if values is None else _records_from_values(LocalAlignmentInfo, _LOCAL_DTYPE, values)
+        self._local_block = None
+
+    def _local_records(self) -> Optional[np.ndarray]:
+        if self._local_block is not None:
+            self._locals = _parse_block(self._local_block, _parse_locals)
+            self._local_block = None
+        return self._locals
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AreTomo3ALN):
+            return NotImplemented
+
+        own_locals, other_locals = self._local_records(), other._local_records()
+        if own_locals is None or other_locals is None:
+            locals_equal = own_locals is None and other_locals is None
+        else:
+            locals_equal = np.array_equal(own_locals, other_locals)
+
+        return self.__dict__ == other.__dict__ and np.array_equal(self._globals, other._globals) and locals_equal
+
+    @classmethod
+    def from_string(cls, text: Union[str, bytes], load_locals: bool = False) -> "AreTomo3ALN":
+        return cls.from_bytes(text.encode() if isinstance(text, str) else text, load_locals=load_locals)
 
     @classmethod
-    def from_string(cls, text: str) -> "AreTomo3ALN":
-        text = text.strip()
-        lines = text.splitlines()
+    def from_bytes(cls, data: BufferType, load_locals: bool = False) -> "AreTomo3ALN":
+        """Parse an AreTomo3 alignment file.
 
-        header = None
-        raw_size = None
-        num_patches = None
+        Args:
+            data (BufferType): Contents of the file.
+            load_locals (bool): Parse the local alignments immediately. By default, they are parsed when first accessed.
+
+        Returns:
+            AreTomo3ALN: The alignment.
+        """
+        # Header lines precede the global alignment table, which is followed by the local alignment table. The tables
+        # are sliced out as contiguous blocks and handed to numpy's parser without decoding.
+        end = len(data)
+        global_start = data.find(b"# SEC")
+        local_start = data.find(b"# Local Alignment")
+        header_end = min(i for i in (global_start, local_start, end) if i != -1)
+
+        global_block = b""
+        if global_start != -1:
+            global_end = local_start if local_start > global_start else end
+            global_block = data[_next_line(data, global_start) : global_end]
+
+        local_block = b""
+        if local_start != -1:
+            local_block = data[_next_line(data, local_start) :]
+
+        params = dict.fromkeys(["header", "RawSize", "NumPatches", "AlphaOffset", "BetaOffset"])
         dark_frames = []
-        alpha_offset = None
-        beta_offset = None
-        global_alignments = []
-        local_alignments = []
-        section = None
-
-        for _i, line in enumerate(lines):
-            if line.startswith("# AreTomo Alignment"):
-                header = line
-                continue
-            elif line.startswith("# RawSize"):
-                raw_size = tuple(map(int, line.split("=")[1].split()))
-                continue
-            elif line.startswith("# NumPatches"):
-                num_patches = int(line.split("=")[1])
-                continue
-            elif line.startswith("# DarkFrame"):
-                dark_frames.append(DarkFrameInfo.from_string(line))
-                continue
-            elif line.startswith("# AlphaOffset"):
-                alpha_offset = float(line.split("=")[1])
-                continue
-            elif line.startswith("# BetaOffset"):
-                beta_offset = float(line.split("=")[1])
-                continue
-            elif line.startswith("# SEC"):
-                section = "GlobalAlignment"
-                continue
-            elif line.startswith("# Local Alignment"):
-                section = "LocalAlignment"
+
+        # Header lines are classified by their first word after "# ", e.g. "# RawSize = 2032 2032 90" -> b"RawSize"
+        for line in data[:header_end].splitlines():
+            tokens = line.split(None, 2)
+            if len(tokens) < 2 or tokens[0] != b"#":
                 continue
 
-            if section == "GlobalAlignment":
-                global_alignments.append(GlobalAlignmentInfo.from_string(line))
-            elif section == "LocalAlignment":
-                local_alignments.append(LocalAlignmentInfo.from_string(line))
-
-        return cls(
-            header=header,
-            RawSize=raw_size,
-            NumPatches=num_patches,
-            DarkFrames=dark_frames,
-            AlphaOffset=alpha_offset,
-            BetaOffset=beta_offset,
-            GlobalAlignments=global_alignments,
-            LocalAlignments=local_alignments,
-        )
+            key = tokens[1]
+            if key in _HEADER_FIELDS:
+                name, convert = _HEADER_FIELDS[key]
+                params[name] = convert(line.partition(b"=")[2])
+            elif key == b"DarkFrame":
+                dark_frames.append(DarkFrameInfo.from_string(line.decode()))
+            elif key == b"AreTomo":
+                params["header"] = line.strip().decode()
+
+        aln = cls(**params, DarkFrames=dark_frames)
+        # Freshly parsed, store without the setter's copy
+        aln._globals = _parse_block(global_block, _parse_globals)
+        aln._local_block = bytes(local_block)
+        if load_locals:
+            aln._local_records()
+
+        return aln
 
     def __str__(self) -> str:
         dark_frames = "\n".join(map(str, self.DarkFrames))
-        global_alignments = "\n".join(map(str, self.GlobalAlignments))
-        local_alignments = "" if self.LocalAlignments is None else "\n".join(map(str, self.LocalAlignments))
+        # Format the tables straight from the record tuples, without materializing models
+        global_alignments = "\n".join(_GLOBAL_FMT % row for row in self._globals.tolist())
+        local_records = self._local_records()
+        local_alignments = (
+            "" if local_records is None else "\n".join(_LOCAL_FMT % row for row in local_records.tolist())
+        )
         return (
             f"{self.header}\n"
             f"# RawSize = {self.RawSize[0]} {self.RawSize[1]} {self.RawSize[2]}\n"
@@ -271,7 +444,7 @@ class AreTomo3ALN(FileIOBase):
     def get_global_alignments(
         self,
         kind: str = "numpy",
-    ) -> Union[np.ndarray, pd.DataFrame]:
+    ) -> Union[np.ndarray, "pd.DataFrame"]:
         """Get the global alignments as a numpy array or pandas DataFrame.
 
         Args:
@@ -283,44 +456,31 @@ class AreTomo3ALN(FileIOBase):
                 have 10 columns with the names of the fields in GlobalAlignmentInfo.
         """
         if kind == "numpy":
-            return np.array([list(ga) for ga in self.GlobalAlignments])
+            return rfn.structured_to_unstructured(self._globals, dtype=np.float64)
         elif kind == "pandas":
-            return pd.DataFrame(
-                [list(ga) for ga in self.GlobalAlignments],
-                columns=list(GlobalAlignmentInfo.model_fields.keys()),
-            )
+            import pandas as pd
+
+            return pd.DataFrame.from_records(self._globals)
 
-    def set_global_alignments(self, value: Union[np.ndarray, pd.DataFrame]):
+    def set_global_alignments(self, value: Union[np.ndarray, "pd.DataFrame"]):
         """
         Set the global alignments from a numpy array or pandas DataFrame.
 
         Args:
             value (Union[np.ndarray, pd.DataFrame]): Global alignments as a numpy array or pandas DataFrame.
         """
-        global_alignments = []
         if isinstance(value, np.ndarray):
             assert value.shape[1] == 10, "Global alignment must have 10 columns."
-
-            for row in value:
-                global_alignments.append(
-                    GlobalAlignmentInfo(**dict(zip(GlobalAlignmentInfo.model_fields, row))),
-                )
-
-        elif isinstance(value, pd.DataFrame):
-            global_alignments = []
-            for _, row in value.iterrows():
-                global_alignments.append(
-                    GlobalAlignmentInfo(**{v: row[v] for v in GlobalAlignmentInfo.model_fields}),
-                )
+            self.GlobalAlignments = value
+        elif is_dataframe(value):
+            self.GlobalAlignments = value[list(GlobalAlignmentInfo.model_fields)].to_records(index=False)
         else:
             raise ValueError("Invalid value type. Must be numpy.ndarray or pandas.DataFrame")
 
-        self.GlobalAlignments = global_alignments
-
     def get_local_alignments(
         self,
         kind: str = "numpy",
-    ) -> Union[np.ndarray, pd.DataFrame]:
+    ) -> Union[np.ndarray, "pd.DataFrame"]:
         """Get the local alignments as a numpy array or pandas DataFrame.
 
         Args:
@@ -332,38 +492,27 @@ class AreTomo3ALN(FileIOBase):
                 have 7 columns with the names of the fields in LocalAlignmentInfo.
         """
         if kind == "numpy":
-            return np.array([list(la) for la in self.LocalAlignments])
+            return rfn.structured_to_unstructured(self._local_records(), dtype=np.float64)
         elif kind == "pandas":
-            return pd.DataFrame(
-                [list(la) for la in self.LocalAlignments],
-                columns=list(LocalAlignmentInfo.model_fields.keys()),
-            )
+            import pandas as pd
+
+            return pd.DataFrame.from_records(self._local_records())
 
-    def set_local_alignments(self, values: Union[np.ndarray, pd.DataFrame]):
+    def set_local_alignments(self, values: Union[np.ndarray, "pd.DataFrame"]):
         """
         Set the local alignments from a numpy array or pandas DataFrame.
 
         Args:
             values (Union[np.ndarray, pd.DataFrame]): Local alignments as a numpy array or pandas DataFrame.
         """
-        local_alignments = []
         if isinstance(values, np.ndarray):
             assert values.shape[1] == 7, "Local alignment must have 7 columns."
-
-            for row in values:
-                local_alignments.append(
-                    LocalAlignmentInfo(**dict(zip(LocalAlignmentInfo.model_fields, row))),
-                )
-
-        elif isinstance(values, pd.DataFrame):
-            local_alignments = []
-            for _, row in values.iterrows():
-                local_alignments.append(LocalAlignmentInfo(**{v: row[v] for v in LocalAlignmentInfo.model_fields}))
+            self.LocalAlignments = values
+        elif is_dataframe(values):
+            self.LocalAlignments = values[list(LocalAlignmentInfo.model_fields)].to_records(index=False)
         else:
             raise ValueError("Invalid value type. Must be numpy.ndarray or pandas.DataFrame")
 
-        self.LocalAlignments = local_alignments
-
     def numpy(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get the global and local alignments as numpy arrays.
@@ -373,7 +522,7 @@ class AreTomo3ALN(FileIOBase):
         """
         return self.get_global_alignments("numpy"), self.get_local_alignments("numpy")
 
-    def pandas(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def pandas(self) -> Tuple["pd.DataFrame", "pd.DataFrame"]:
         """
         Get the global and local alignments as pandas DataFrames.
 
@@ -1,11 +1,27 @@
+import mmap
 import os
-from typing import TextIO, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, TextIO, Type, Union
 
-import fsspec
-import s3fs
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    import fsspec
+
 PATH_TYPE = Union[str, bytes, os.PathLike]
+_PATH_TYPES = (str, bytes, os.PathLike)
+
+# Raw file contents, e.g. bytes or a memory-mapped file
+BufferType = Union[bytes, bytearray, mmap.mmap]
+
+# Files from this size on are memory-mapped instead of read
+_MMAP_MIN_SIZE = 128 * 1024
+
+
+def _filesystem(protocol: str, kwargs: Dict[str, Any]) -> "fsspec.AbstractFileSystem":
+    # fsspec (and s3fs, which fsspec resolves for "s3") are slow to import, only pay for them for remote files
+    import fsspec
+
+    return fsspec.filesystem(protocol, **kwargs)
 
 
 class FileIOBase(BaseModel):
@@ -14,52 +30,115 @@ class FileIOBase(BaseModel):
         return cls()
 
     @classmethod
-    def from_stream(cls, stream: TextIO):
-        return cls.from_string(stream.read())
+    def from_bytes(cls, data: BufferType, **kwargs):
+        text = str(data, "utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        return cls.from_string(text, **kwargs)
+
+    @classmethod
+    def from_stream(cls, stream: TextIO, **kwargs):
+        return cls.from_string(stream.read(), **kwargs)
 
     def to_stream(self, stream: TextIO) -> None:
         stream.write(str(self))
 
     @classmethod
-    def from_file(cls, file_path: PATH_TYPE):
-        with open(file_path, "r") as file:
-            return cls.from_stream(file)
+    def from_file(cls, file_path: PATH_TYPE, **kwargs):
+        with open(file_path, "rb") as file:
+            # Mapping only pays off for large files, read small ones in one go (empty files cannot be mapped)
+            if os.fstat(file.fileno()).st_size < _MMAP_MIN_SIZE:
+                return cls.from_bytes(file.read(), **kwargs)
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return cls.from_bytes(mm, **kwargs)
 
     def to_file(self, file_path: PATH_TYPE) -> None:
-        with open(file_path, "w") as file:
-            self.to_stream(file)
+        # Serialize once and hand the whole payload to the OS, bypassing the text layer's small-chunk writes
+        data = memoryview(str(self).encode())
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def from_s3(cls, s3_path: str, parser_kwargs: Optional[Dict[str, Any]] = None, **kwargs):
+        # kwargs configure the filesystem, parser options (e.g. load_locals) are passed separately
+        fs = _filesystem("s3", kwargs)
+        with fs.open(s3_path, "rb") as file:
+            return cls.from_bytes(file.read(), **(parser_kwargs or {}))
 
     @classmethod
-    def from_s3(cls, s3_path: str, **kwargs):
-        fs = s3fs.S3FileSystem(**kwargs)
-        with fs.open(s3_path, "r") as file:
-            return cls.from_stream(file)
+    def from_s3_many(
+        cls,
+        s3_paths: Iterable[str],
+        parser_kwargs: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> List["FileIOBase"]:
+        """Read many files from S3, fetching them concurrently.
+
+        Args:
+            s3_paths: The S3 paths of the files.
+            parser_kwargs: Options passed to `from_bytes`, e.g. `load_locals` for AreTomo3 files.
+            **kwargs: Options passed to `s3fs.S3FileSystem`.
+
+        Returns:
+            List[FileIOBase]: The parsed objects, in the order of `s3_paths`.
+        """
+        return cls.from_fs_many("s3", s3_paths, parser_kwargs=parser_kwargs, **kwargs)
 
     def to_s3(self, s3_path: str, **kwargs) -> None:
-        fs = s3fs.S3FileSystem(**kwargs)
+        fs = _filesystem("s3", kwargs)
         with fs.open(s3_path, "w") as file:
             self.to_stream(file)
 
     @classmethod
-    def from_fs(cls, protocol: str, fs_path: str, **kwargs):
-        fs = fsspec.filesystem(protocol, **kwargs)
-        with fs.open(fs_path, "r") as file:
-            return cls.from_stream(file)
+    def from_fs(cls, protocol: str, fs_path: str, parser_kwargs: Optional[Dict[str, Any]] = None, **kwargs):
+        fs = _filesystem(protocol, kwargs)
+        with fs.open(fs_path, "rb") as file:
+            return cls.from_bytes(file.read(), **(parser_kwargs or {}))
+
+    @classmethod
+    def from_fs_many(
+        cls,
+        protocol: str,
+        fs_paths: Iterable[str],
+        parser_kwargs: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> List["FileIOBase"]:
+        """Read many files from a filesystem, fetching them concurrently where the filesystem supports it.
+
+        Args:
+            protocol: The fsspec protocol of the filesystem.
+            fs_paths: The paths of the files. They are read as given, i.e. not glob-expanded.
+            parser_kwargs: Options passed to `from_bytes`, e.g. `load_locals` for AreTomo3 files.
+            **kwargs: Options passed to the filesystem.
+
+        Returns:
+            List[FileIOBase]: The parsed objects, in the order of `fs_paths`.
+        """
+        fs = _filesystem(protocol, kwargs)
+        fs_paths = list(fs_paths)
+        contents = fs.cat_ranges(fs_paths, None, None, on_error="raise") if fs_paths else []
+        parser_kwargs = parser_kwargs or {}
+        return [cls.from_bytes(data, **parser_kwargs) for data in contents]
 
     def to_fs(self, protocol: str, fs_path: str, **kwargs) -> None:
-        fs = fsspec.filesystem(protocol, **kwargs)
+        fs = _filesystem(protocol, kwargs)
         with fs.open(fs_path, "w") as file:
             self.to_stream(file)
 
 
 def read_generic(input_file: Union[PATH_TYPE, TextIO], clz: Type[FileIOBase], **kwargs):
-    if isinstance(input_file, PATH_TYPE):
-        input_file = str(input_file)
+    if isinstance(input_file, _PATH_TYPES):
+        input_file = os.fsdecode(input_file)
+        protocol, sep, _ = input_file.partition("://")
 
-        if input_file.startswith("s3://"):
+        if protocol == "s3" and sep:
             return clz.from_s3(input_file, **kwargs)
-        elif "://" in input_file:
-            protocol = input_file.split("://")[0]
+        elif sep:
             return clz.from_fs(protocol, input_file, **kwargs)
         else:
             return clz.from_file(input_file)
@@ -70,12 +149,13 @@ def read_generic(input_file: Union[PATH_TYPE, TextIO], clz: Type[FileIOBase], **
 
 
 def write_generic(output_file: Union[PATH_TYPE, TextIO], data: FileIOBase, **kwargs) -> None:
-    if isinstance(output_file, PATH_TYPE):
-        output_file = str(output_file)
-        if output_file.startswith("s3://"):
+    if isinstance(output_file, _PATH_TYPES):
+        output_file = os.fsdecode(output_file)
+        protocol, sep, _ = output_file.partition("://")
+
+        if protocol == "s3" and sep:
             data.to_s3(output_file, **kwargs)
-        elif "://" in output_file:
-            protocol = output_file.split("://")[0]
+        elif sep:
             data.to_fs(protocol, output_file, **kwargs)
         else:
             data.to_file(output_file)
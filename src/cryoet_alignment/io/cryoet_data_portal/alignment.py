@@ -1,12 +1,13 @@
-import json
+import math
 import os
-from typing import Dict, List, Optional, Tuple
+from itertools import repeat
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from cryoet_alignment.io.aretomo3 import AreTomo3ALN
-from cryoet_alignment.io.aretomo3.aln import DarkFrameInfo, GlobalAlignmentInfo
+from cryoet_alignment.io.aretomo3.aln import DarkFrameInfo
 from cryoet_alignment.io.base import FileIOBase
 from cryoet_alignment.io.imod import ImodAlignment, ImodNEWSTCOM, ImodTILTCOM, ImodTLT, ImodXF, ImodXTILT
 from cryoet_alignment.io.imod.xf import ImodXFInfo
@@ -14,28 +15,64 @@ from cryoet_alignment.util.image import get_mrc_header_local
 
 
 def ang2mat(angle):
-    angle = np.radians(angle)
-    mat = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
-    return mat
+    angle = math.radians(angle)
+    c, s = math.cos(angle), math.sin(angle)
+    return [[c, -s], [s, c]]
 
 
 def mat2ang(mat):
-    return np.degrees(np.arctan2(mat[1, 0], mat[0, 0]))
+    return math.degrees(math.atan2(mat[1][0], mat[0][0]))
+
+
+def _transpose_shift(mat, shift) -> Tuple[float, float, float, float, float, float]:
+    """are2imod on plain floats, returns the transposed matrix (row-major) and the shift as six floats."""
+    (mxx, mxy), (myx, myy) = mat
+    sx, sy = shift
+    # Transpose and shift = mat.T @ -shift, written out for the 2x2 case
+    return mxx, myx, mxy, myy, -(mxx * sx + myx * sy), -(mxy * sx + myy * sy)
 
 
 def are2imod(mat, shift):
-    mat = mat.transpose()
-    shift = mat @ (-1 * np.array(shift))
-    return mat, shift
+    mxx, mxy, myx, myy, sx, sy = _transpose_shift(mat, shift)
+    return np.array([[mxx, mxy], [myx, myy]]), np.array([sx, sy])
 
 
 def imod2are(mat, shift):
-    mat = mat.transpose()
-    shift = mat @ -shift
-    return mat, shift
+    # The transform is its own inverse
+    return are2imod(mat, shift)
+
+
+def _are2imod_xf(mat: List[List[float]], x_offset: float, y_offset: float) -> ImodXFInfo:
+    """are2imod for one section on plain floats, straight to an .xf row."""
+    return ImodXFInfo(*_transpose_shift(mat, (x_offset, y_offset)))
+
+
+def _batched_imod2are(mats: np.ndarray, shifts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized imod2are for (N, 2, 2) matrices and (N, 2) shifts."""
+    mats_t = np.transpose(mats, (0, 2, 1))
+    offsets = -np.einsum("nij,nj->ni", mats_t, shifts)
+    return mats_t, offsets
+
+
+def _batched_ang2mat(angles: np.ndarray) -> np.ndarray:
+    """Vectorized ang2mat for (N,) angles in degrees, returns (N, 2, 2) matrices."""
+    angles = np.radians(angles)
+    c, s = np.cos(angles), np.sin(angles)
+    return np.stack([np.stack([c, -s], axis=-1), np.stack([s, c], axis=-1)], axis=-2)
+
+
+class _SectionArrays(NamedTuple):
+    z_index: np.ndarray
+    tilt_angle: np.ndarray
+    volume_x_rotation: np.ndarray
+    tilt_axis_rotation: np.ndarray
+    x_offset: np.ndarray
+    y_offset: np.ndarray
 
 
 class PerSectionAlignmentParameters(BaseModel):
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
     z_index: int
     tilt_angle: float
     volume_x_rotation: float
@@ -45,14 +82,21 @@ class PerSectionAlignmentParameters(BaseModel):
 
     @property
     def tilt_axis_rotation(self) -> float:
-        return mat2ang(np.array(self.in_plane_rotation))
+        return mat2ang(self.in_plane_rotation)
 
     @tilt_axis_rotation.setter
     def tilt_axis_rotation(self, value: float):
-        self.in_plane_rotation = ang2mat(value).tolist()
+        self.in_plane_rotation = ang2mat(value)
+
+
+# Validates all sections in one call into pydantic-core
+_SECTION_LIST = TypeAdapter(List[PerSectionAlignmentParameters])
 
 
 class Alignment(FileIOBase):
+    # Write NaN/inf as JSON constants (like json.dumps), so that they survive a round trip
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
     affine_transformation_matrix: List[List[float]]
     alignment_type: str
     format: str
@@ -65,10 +109,10 @@ class Alignment(FileIOBase):
 
     @classmethod
     def from_string(cls, text: str):
-        return cls(**json.loads(text))
+        return cls.model_validate_json(text)
 
     def __str__(self):
-        return json.dumps(self.model_dump())
+        return self.model_dump_json()
 
     @classmethod
     def from_imod(
@@ -89,7 +133,6 @@ class Alignment(FileIOBase):
         tilt_offset = 0
         volume_offset = {"x": 0, "y": 0, "z": 0}
         x_rotation_offset = 0
-        per_section_alignment_parameters = []
 
         if vol is not None:
             header = get_mrc_header_local(vol)
@@ -105,36 +148,48 @@ class Alignment(FileIOBase):
 
         volume_dimension = {"x": x, "y": y, "z": z}
 
-        it = (
-            zip(xf.alignments, tlt.angles, [0.0] * len(tlt.angles))
-            if xtlt is None
-            else zip(xf.alignments, tlt.angles, xtlt.angles)
-        )
-
         skip = []
         if tiltcom is not None:
             skip = tiltcom.EXCLUDELIST2 if tiltcom.EXCLUDELIST2 is not None else []
             skip = [s - 1 for s in skip]
 
-        for z_index, (xf_alignment, tilt_angle, xtlt_angle) in enumerate(it):
-            if z_index in skip:
-                continue
-
-            volume_x_rotation = xtlt_angle
-
-            in_plane_rotation, offset = imod2are(xf_alignment.rot_matrix(), xf_alignment.shift())
-            x_offset, y_offset = offset[0], offset[1]
-
-            per_section_alignment_parameters.append(
-                PerSectionAlignmentParameters(
-                    z_index=z_index,
-                    tilt_angle=tilt_angle,
-                    volume_x_rotation=volume_x_rotation,
-                    in_plane_rotation=in_plane_rotation.tolist(),
-                    x_offset=x_offset,
-                    y_offset=y_offset,
-                ),
-            )
+        # Same truncation as zipping xf, tlt and xtilt
+        num_sections = min(len(xf.alignments), len(tlt.angles))
+        if xtlt is not None:
+            num_sections = min(num_sections, len(xtlt.angles))
+        xf_arr = xf.numpy()[:num_sections]
+        tilt_angles = np.asarray(tlt.angles[:num_sections], dtype=np.float64)
+
+        keep = np.ones(num_sections, dtype=bool)
+        skip_idx = [s for s in skip if 0 <= s < num_sections]
+        keep[skip_idx] = False
+        z_indices = np.flatnonzero(keep)
+
+        mats, offsets = _batched_imod2are(xf_arr[keep, :4].reshape(-1, 2, 2), xf_arr[keep, 4:6])
+        if xtlt is None:
+            xtlt_angles = repeat(0.0)
+        else:
+            xtlt_angles = np.asarray(xtlt.angles[:num_sections], dtype=np.float64)[keep].tolist()
+
+        per_section_alignment_parameters = _SECTION_LIST.validate_python(
+            [
+                {
+                    "z_index": z_index,
+                    "tilt_angle": tilt_angle,
+                    "volume_x_rotation": volume_x_rotation,
+                    "in_plane_rotation": in_plane_rotation,
+                    "x_offset": x_offset,
+                    "y_offset": y_offset,
+                }
+                for z_index, tilt_angle, volume_x_rotation, in_plane_rotation, (x_offset, y_offset) in zip(
+                    z_indices.tolist(),
+                    tilt_angles[keep].tolist(),
+                    xtlt_angles,
+                    mats.tolist(),
+                    offsets.tolist(),
+                )
+            ],
+        )
 
         return cls(
             affine_transformation_matrix=affine_transform,
@@ -163,14 +218,15 @@ class Alignment(FileIOBase):
         tilt_offset = aln.AlphaOffset
         volume_offset = {"x": 0, "y": 0, "z": 0}
         x_rotation_offset = aln.BetaOffset
-        per_section_alignment_parameters = []
+
+        # Columns of the global alignment table: sec, rot, gmag, tx, ty, smean, sfit, scale, base, tilt
+        globals_arr = aln.get_global_alignments("numpy")
 
         full_size = aln.RawSize[2]
-        orig_sections = list(range(full_size))
-        for d in aln.DarkFrames:
-            orig_sections.remove(d.section_idx)
+        dark = {d.section_idx for d in aln.DarkFrames}
+        orig_sections = sorted(set(range(full_size)) - dark)
         assert len(orig_sections) == len(
-            aln.GlobalAlignments,
+            globals_arr,
         ), "Number of sections does not match number of DarkFrames."
 
         if vol is not None:
@@ -188,24 +244,27 @@ class Alignment(FileIOBase):
             x, y, z = 0, 0, 0
             volume_dimension = {"x": x, "y": y, "z": z}
 
-        for idx, ali in zip(orig_sections, aln.GlobalAlignments):
-            z_index = idx
-            tilt_angle = ali.tilt
-            volume_x_rotation = 0
-            in_plane_rotation = ang2mat(ali.rot).tolist()
-            x_offset = ali.tx
-            y_offset = ali.ty
-
-            per_section_alignment_parameters.append(
-                PerSectionAlignmentParameters(
-                    z_index=z_index,
-                    tilt_angle=tilt_angle,
-                    volume_x_rotation=volume_x_rotation,
-                    in_plane_rotation=in_plane_rotation,
-                    x_offset=x_offset,
-                    y_offset=y_offset,
-                ),
-            )
+        mats = _batched_ang2mat(globals_arr[:, 1])
+
+        per_section_alignment_parameters = _SECTION_LIST.validate_python(
+            [
+                {
+                    "z_index": z_index,
+                    "tilt_angle": tilt_angle,
+                    "volume_x_rotation": 0,
+                    "in_plane_rotation": in_plane_rotation,
+                    "x_offset": x_offset,
+                    "y_offset": y_offset,
+                }
+                for z_index, tilt_angle, in_plane_rotation, x_offset, y_offset in zip(
+                    orig_sections,
+                    globals_arr[:, 9].tolist(),
+                    mats.tolist(),
+                    globals_arr[:, 3].tolist(),
+                    globals_arr[:, 4].tolist(),
+                )
+            ],
+        )
 
         return cls(
             affine_transformation_matrix=affine_transform,
@@ -245,23 +304,16 @@ class Alignment(FileIOBase):
         xtlt_info = []
         exclude = []
 
-        # To determine the excluded sections, we need to know the z_index of each section
-        secs = {p.z_index: p for p in self.per_section_alignment_parameters}
-
-        for z_index in range(ts_size[2]):
-            if z_index not in secs:
+        for z_index, sec in enumerate(self._sections_by_index(ts_size[2])):
+            if sec is None:
                 tlt_info.append(0)
                 xtlt_info.append(0)
                 xf_info.append(ImodXFInfo(mxx=1, mxy=0, myx=0, myy=1, sx=0, sy=0))
                 exclude.append(str(z_index + 1))
             else:
-                tlt_info.append(secs[z_index].tilt_angle)
-                xtlt_info.append(secs[z_index].volume_x_rotation)
-                mat = np.array(secs[z_index].in_plane_rotation)
-                mat, shift = are2imod(mat, [secs[z_index].x_offset, secs[z_index].y_offset])
-                xf_info.append(
-                    ImodXFInfo(mxx=mat[0, 0], mxy=mat[0, 1], myx=mat[1, 0], myy=mat[1, 1], sx=shift[0], sy=shift[1]),
-                )
+                tlt_info.append(sec.tilt_angle)
+                xtlt_info.append(sec.volume_x_rotation)
+                xf_info.append(_are2imod_xf(sec.in_plane_rotation, sec.x_offset, sec.y_offset))
 
         # Create the IMOD alignment files
         xf = ImodXF(alignments=xf_info)
@@ -316,34 +368,32 @@ class Alignment(FileIOBase):
         self,
         ts_size: Tuple[int, int, int],
     ):
-        # To determine the excluded sections, we need to know the z_index of each section
-        secs = {p.z_index: p for p in self.per_section_alignment_parameters}
-        dark_frames = []
-        for z_index in range(ts_size[2]):
-            if z_index not in secs:
-                dark_frames.append(DarkFrameInfo(section_idx=z_index, val2=0, angle=0))
+        dark_frames = [
+            DarkFrameInfo(section_idx=z_index, val2=0, angle=0) for z_index in self.get_skipped_sections(ts_size)
+        ]
 
         raw_size = ts_size
         num_patches = 0
         alpha_offset = self.tilt_offset
         beta_offset = self.x_rotation_offset
-        global_alignments = []
-
-        for p in self.per_section_alignment_parameters:
-            global_alignments.append(
-                GlobalAlignmentInfo(
-                    sec=p.z_index,
-                    rot=p.tilt_axis_rotation,
-                    gmag=1.0,
-                    tx=p.x_offset,
-                    ty=p.y_offset,
-                    smean=1.0,
-                    sfit=1.0,
-                    scale=1.0,
-                    base=0.0,
-                    tilt=p.tilt_angle,
-                ),
-            )
+        soa = self._as_soa()
+        ones = np.ones(len(soa.z_index))
+
+        # Columns of the global alignment table: sec, rot, gmag, tx, ty, smean, sfit, scale, base, tilt
+        global_alignments = np.column_stack(
+            [
+                soa.z_index,
+                soa.tilt_axis_rotation,
+                ones,
+                soa.x_offset,
+                soa.y_offset,
+                ones,
+                ones,
+                ones,
+                np.zeros_like(ones),
+                soa.tilt_angle,
+            ],
+        )
 
         return AreTomo3ALN(
             RawSize=raw_size,
@@ -355,15 +405,33 @@ class Alignment(FileIOBase):
         )
 
     def get_skipped_sections(self, ts_size: Tuple[int, int, int]):
-        full_size = list(range(ts_size[2]))
-        present_idx = [p.z_index for p in self.per_section_alignment_parameters]
-        excl = []
+        present_idx = {p.z_index for p in self.per_section_alignment_parameters}
+        return [idx for idx in range(ts_size[2]) if idx not in present_idx]
 
-        for idx in full_size:
-            if idx not in present_idx:
-                excl.append(idx)
-
-        return excl
+    def _sections_by_index(self, num_sections: int) -> List[Optional[PerSectionAlignmentParameters]]:
+        """Parameters of each section in range(num_sections), None for sections without parameters."""
+        # Direct-address table, later duplicates win like in a dict
+        sections = [None] * num_sections
+        for p in self.per_section_alignment_parameters:
+            if 0 <= p.z_index < num_sections:
+                sections[p.z_index] = p
+        return sections
 
     def get_median_tilt_axis(self):
-        return np.median([p.tilt_axis_rotation for p in self.per_section_alignment_parameters])
+        return float(np.median(self._as_soa().tilt_axis_rotation))
+
+    def _as_soa(self) -> "_SectionArrays":
+        """Per-section parameters as one array per parameter.
+
+        Not cached, per_section_alignment_parameters is a mutable list.
+        """
+        params = self.per_section_alignment_parameters
+        mats = np.array([p.in_plane_rotation for p in params], dtype=np.float64).reshape(-1, 2, 2)
+        return _SectionArrays(
+            z_index=np.array([p.z_index for p in params], dtype=np.int64),
+            tilt_angle=np.array([p.tilt_angle for p in params], dtype=np.float64),
+            volume_x_rotation=np.array([p.volume_x_rotation for p in params], dtype=np.float64),
+            tilt_axis_rotation=np.degrees(np.arctan2(mats[:, 1, 0], mats[:, 0, 0])),
+            x_offset=np.array([p.x_offset for p in params], dtype=np.float64),
+            y_offset=np.array([p.y_offset for p in params], dtype=np.float64),
+        )
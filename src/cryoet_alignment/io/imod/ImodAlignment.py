@@ -1,8 +1,11 @@
 import os
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Type, Union
 
 from pydantic import BaseModel
 
+from cryoet_alignment.io.base import FileIOBase
 from cryoet_alignment.io.imod.newst import ImodNEWSTCOM
 from cryoet_alignment.io.imod.rawtlt import ImodTLT, ImodXTILT
 from cryoet_alignment.io.imod.tilt import ImodTILTCOM
@@ -11,6 +14,18 @@ from cryoet_alignment.io.imod.xf import ImodXF
 PATH_TYPE = Union[str, bytes, os.PathLike]
 
 
+def _maybe_read(clz: Type[FileIOBase], path: PATH_TYPE) -> Optional[FileIOBase]:
+    """Read an optional file, returns None if it does not exist."""
+    try:
+        return clz.from_file(path)
+    except FileNotFoundError:
+        return None
+
+
+def _skip() -> None:
+    return None
+
+
 class ImodAlignment(BaseModel):
     xf: ImodXF
     tlt: ImodTLT
@@ -27,7 +42,12 @@ class ImodAlignment(BaseModel):
         xtilt_path: PATH_TYPE = None,
         tiltcom_path: PATH_TYPE = None,
         newstcom_path: PATH_TYPE = None,
+        max_workers: int = 1,
     ):
+        """Read an IMOD alignment, either from a basename or from the individual file paths.
+
+        Set `max_workers` > 1 to read the files concurrently, which hides latency on network file systems.
+        """
         if not base_name and not all([xf_path, tlt_path]):
             raise ValueError("Either base_name or xf_path and tlt_path must be provided.")
 
@@ -35,18 +55,29 @@ class ImodAlignment(BaseModel):
             raise ValueError("Either base_name or xf_path and tlt_path must be provided, not both.")
 
         if base_name:
-            xf = ImodXF.from_file(f"{base_name}.xf")
-            tlt = ImodTLT.from_file(f"{base_name}.tlt")
-            xtilt = ImodXTILT.from_file(f"{base_name}.xtilt") if os.path.exists(f"{base_name}.xtilt") else None
             parent = os.path.dirname(base_name)
-            tiltcom = ImodTILTCOM.from_file(f"{parent}/tilt.com") if os.path.exists(f"{parent}/tilt.com") else None
-            newstcom = ImodNEWSTCOM.from_file(f"{parent}/newst.com") if os.path.exists(f"{parent}/newst.com") else None
+            readers = [
+                partial(ImodXF.from_file, f"{base_name}.xf"),
+                partial(ImodTLT.from_file, f"{base_name}.tlt"),
+                partial(_maybe_read, ImodXTILT, f"{base_name}.xtilt"),
+                partial(_maybe_read, ImodTILTCOM, f"{parent}/tilt.com"),
+                partial(_maybe_read, ImodNEWSTCOM, f"{parent}/newst.com"),
+            ]
+        else:
+            readers = [
+                partial(ImodXF.from_file, xf_path),
+                partial(ImodTLT.from_file, tlt_path),
+                partial(ImodXTILT.from_file, xtilt_path) if xtilt_path else _skip,
+                partial(ImodTILTCOM.from_file, tiltcom_path) if tiltcom_path else _skip,
+                partial(ImodNEWSTCOM.from_file, newstcom_path) if newstcom_path else _skip,
+            ]
+
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(reader) for reader in readers]
+                xf, tlt, xtilt, tiltcom, newstcom = [future.result() for future in futures]
         else:
-            xf = ImodXF.from_file(xf_path)
-            tlt = ImodTLT.from_file(tlt_path)
-            xtilt = ImodXTILT.from_file(xtilt_path) if xtilt_path else None
-            tiltcom = ImodTILTCOM.from_file(tiltcom_path) if tiltcom_path else None
-            newstcom = ImodNEWSTCOM.from_file(newstcom_path) if newstcom_path else None
+            xf, tlt, xtilt, tiltcom, newstcom = [reader() for reader in readers]
 
         return cls(xf=xf, tlt=tlt, xtilt=xtilt, tiltcom=tiltcom, newstcom=newstcom)
 
@@ -3,6 +3,21 @@ from typing import Optional, Tuple
 
 from cryoet_alignment.io.base import FileIOBase
 
+# Line patterns keyed by the leading token of the line, (pattern, groups)
+_PATTERNS = {
+    "AntialiasFilter": (re.compile(r"^AntialiasFilter\s+(-?\d+)$"), (1,)),
+    "InputFile": (re.compile(r"^InputFile\s+(.+)$"), (1,)),
+    "OutputFile": (re.compile(r"^OutputFile\s+(.+)$"), (1,)),
+    "TransformFile": (re.compile(r"^TransformFile\s+(.+)$"), (1,)),
+    "TaperAtFill": (re.compile(r"^TaperAtFill\s+(\d+),(\d+)$"), (1, 2)),
+    "AdjustOrigin": (re.compile(r"^AdjustOrigin\s*$"), ()),
+    "OffsetsInXandY": (re.compile(r"^OffsetsInXandY\s+(-?[\d.]+),(-?[\d.]+)$"), (1, 2)),
+    "DistortionField": (re.compile(r"^DistortionField\s+(.+)$"), (1,)),
+    "ImagesAreBinned": (re.compile(r"^ImagesAreBinned\s+([\d.]+)$"), (1,)),
+    "BinByFactor": (re.compile(r"^BinByFactor\s+(\d+)$"), (1,)),
+    "GradientFile": (re.compile(r"^GradientFile\s+(.+)$"), (1,)),
+}
+
 
 class ImodNEWSTCOM(FileIOBase):
     AntialiasFilter: Optional[int] = -1
@@ -19,54 +34,41 @@ class ImodNEWSTCOM(FileIOBase):
 
     @classmethod
     def from_string(cls, string: str) -> "ImodNEWSTCOM":
-        patterns = {
-            "AntialiasFilter": (r"^AntialiasFilter\s+(-?\d+)$", (1,)),
-            "InputFile": (r"^InputFile\s+(.+)$", (1,)),
-            "OutputFile": (r"^OutputFile\s+(.+)$", (1,)),
-            "TransformFile": (r"^TransformFile\s+(.+)$", (1,)),
-            "TaperAtFill": (r"^TaperAtFill\s+(\d+),(\d+)$", (1, 2)),
-            "AdjustOrigin": (r"^AdjustOrigin\s*$", ()),
-            "OffsetsInXandY": (r"^OffsetsInXandY\s+(-?[\d.]+),(-?[\d.]+)$", (1, 2)),
-            "DistortionField": (r"^DistortionField\s+(.+)$", (1,)),
-            "ImagesAreBinned": (r"^ImagesAreBinned\s+([\d.]+)$", (1,)),
-            "BinByFactor": (r"^BinByFactor\s+(\d+)$", (1,)),
-            "GradientFile": (r"^GradientFile\s+(.+)$", (1,)),
-        }
-
-        params = {}
+        params = dict.fromkeys(_PATTERNS)
 
-        for key, (pattern, groups) in patterns.items():
-            match = re.search(pattern, string, re.M)
+        # Single pass, the first matching line of each key wins
+        for line in string.splitlines():
+            tokens = line.split(None, 1)
+            key = tokens[0] if tokens else ""
+            if key not in _PATTERNS or params[key] is not None:
+                continue
+            pattern, groups = _PATTERNS[key]
+            match = pattern.match(line)
             if match:
-                if groups:
-                    params[key] = match.group(*groups)
-                else:
-                    params[key] = True
-            else:
-                params[key] = None
+                params[key] = match.group(*groups) if groups else True
 
         return cls(**params)
 
     def __str__(self) -> str:
-        outputs = "$setenv IMOD_OUTPUT_FORMAT MRC\n$newstack -StandardInput\n"
+        outputs = ["$setenv IMOD_OUTPUT_FORMAT MRC\n$newstack -StandardInput\n"]
         if self.AntialiasFilter is not None:
-            outputs += f"AntialiasFilter\t{self.AntialiasFilter}\n"
-        outputs += f"InputFile\t{self.InputFile}\n"
-        outputs += f"OutputFile\t{self.OutputFile}\n"
-        outputs += f"TransformFile\t{self.TransformFile}\n"
-        outputs += f"TaperAtFill\t{self.TaperAtFill[0]},{self.TaperAtFill[1]}\n"
+            outputs.append(f"AntialiasFilter\t{self.AntialiasFilter}\n")
+        outputs.append(f"InputFile\t{self.InputFile}\n")
+        outputs.append(f"OutputFile\t{self.OutputFile}\n")
+        outputs.append(f"TransformFile\t{self.TransformFile}\n")
+        outputs.append(f"TaperAtFill\t{self.TaperAtFill[0]},{self.TaperAtFill[1]}\n")
         if self.AdjustOrigin:
-            outputs += "AdjustOrigin\n"
-        outputs += f"OffsetsInXandY\t{self.OffsetsInXandY[0]},{self.OffsetsInXandY[1]}\n"
+            outputs.append("AdjustOrigin\n")
+        outputs.append(f"OffsetsInXandY\t{self.OffsetsInXandY[0]},{self.OffsetsInXandY[1]}\n")
         if self.DistortionField:
-            outputs += f"DistortionField\t{self.DistortionField}\n"
+            outputs.append(f"DistortionField\t{self.DistortionField}\n")
         else:
-            outputs += "#DistortionField\t.idf\n"
-        outputs += f"ImagesAreBinned\t{self.ImagesAreBinned}\n"
-        outputs += f"BinByFactor\t{self.BinByFactor}\n"
+            outputs.append("#DistortionField\t.idf\n")
+        outputs.append(f"ImagesAreBinned\t{self.ImagesAreBinned}\n")
+        outputs.append(f"BinByFactor\t{self.BinByFactor}\n")
         if self.GradientFile:
-            outputs += f"GradientFile\t{self.GradientFile}\n"
+            outputs.append(f"GradientFile\t{self.GradientFile}\n")
         else:
-            outputs += "#GradientFile\t.maggrad\n"
-        outputs += "$if (-e ./savework) ./savework\n"
-        return outputs
+            outputs.append("#GradientFile\t.maggrad\n")
+        outputs.append("$if (-e ./savework) ./savework\n")
+        return "".join(outputs)
@@ -1,27 +1,31 @@
-from typing import List
+from typing import TYPE_CHECKING, List
 
 import numpy as np
-import pandas as pd
 
 from cryoet_alignment.io.base import FileIOBase
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ImodRAWTLT(FileIOBase):
     angles: List[float]
 
     @classmethod
     def from_string(cls, text: str) -> "ImodRAWTLT":
-        lines = text.strip().split("\n")
-        angles = [float(line) for line in lines]
+        text = text.strip()
+        angles = [float(line) for line in text.split("\n")] if text else []
         return cls(angles=angles)
 
     def __str__(self) -> str:
-        return "\n".join(str(angle) for angle in self.angles) + "\n"
+        return "\n".join(map(str, self.angles)) + "\n"
 
     def numpy(self) -> np.ndarray:
         return np.array(self.angles)
 
-    def pandas(self):
+    def pandas(self) -> "pd.DataFrame":
+        import pandas as pd
+
         return pd.DataFrame(self.angles, columns=["angles"])
 
 
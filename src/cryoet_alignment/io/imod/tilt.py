@@ -5,6 +5,36 @@ from pydantic import Field
 
 from cryoet_alignment.io.base import FileIOBase
 
+# Line patterns of the tilt.com parameters, (pattern, groups)
+_PATTERNS = {
+    "InputProjections": (re.compile(r"^InputProjections\s+(.+)$"), (1,)),
+    "OutputFile": (re.compile(r"^OutputFile\s+(.+)$"), (1,)),
+    "IMAGEBINNED": (re.compile(r"^IMAGEBINNED\s+(\d+)$"), (1,)),
+    "TILTFILE": (re.compile(r"^TILTFILE\s+(.+)$"), (1,)),
+    "THICKNESS": (re.compile(r"^THICKNESS\s+([\d.]+)$"), (1,)),
+    "RADIAL": (re.compile(r"^RADIAL\s+([\d.]+)\s+([\d.]+)$"), (1, 2)),
+    "FalloffIsTrueSigma": (re.compile(r"^FalloffIsTrueSigma\s+(\d+)$"), (1,)),
+    "XAXISTILT": (re.compile(r"^XAXISTILT\s+([\d.]+)$"), (1,)),
+    "SCALE": (re.compile(r"^SCALE\s+([\d.]+)\s+([\d.]+)$"), (1, 2)),
+    "PERPENDICULAR": (re.compile(r"^PERPENDICULAR.*$"), ()),
+    "MODE": (re.compile(r"^MODE\s+(\d+)$"), (1,)),
+    "FULLIMAGE": (re.compile(r"^FULLIMAGE\s+(\d+)\s+(\d+)$"), (1, 2)),
+    "SUBSETSTART": (re.compile(r"^SUBSETSTART\s+([-\d]+)\s+([-\d]+)$"), (1, 2)),
+    "AdjustOrigin": (re.compile(r"^AdjustOrigin.*$"), ()),
+    "ActionIfGPUFails": (re.compile(r"^ActionIfGPUFails\s+(\d+),(\d+)$"), (1, 2)),
+    "XTILTFILE": (re.compile(r"^XTILTFILE\s+(.+)$"), (1,)),
+    "OFFSET": (re.compile(r"^OFFSET\s+(-?[\d.]+)$"), (1,)),
+    "SHIFT": (re.compile(r"^SHIFT\s+(-?[\d.]+)\s+(-?[\d.]+)$"), (1, 2)),
+    "EXCLUDELIST2": (re.compile(r"^(EXCLUDELIST2|EXCLUDELIST|EXCLUDE)\s+(.+)$"), (2,)),
+}
+
+# Leading token of a line -> parameter, the exclude list has several spellings
+_KEY_BY_TOKEN = {key: key for key in _PATTERNS}
+_KEY_BY_TOKEN.update(EXCLUDELIST="EXCLUDELIST2", EXCLUDE="EXCLUDELIST2")
+
+# A single number or range "a-b" of an IMOD range list
+_RANGE_PATTERN = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+))?\s*")
+
 
 def imod_range_to_list(text: str) -> List[int]:
     """Convert a range of numbers in IMOD format to a list of integers.
@@ -16,19 +46,20 @@ def imod_range_to_list(text: str) -> List[int]:
 
     Returns:
         List[int]: The list of integers.
+
+    Raises:
+        ValueError: If an entry is neither a number nor a range.
     """
-    if text == "" or text is None:
+    if not text:
         return []
 
-    parts = text.split(",")
     out = []
-
-    for p in parts:
-        if "-" in p:
-            start, end = p.split("-")
-            out += list(range(int(start), int(end) + 1))
-        else:
-            out.append(int(p))
+    for part in text.split(","):
+        match = _RANGE_PATTERN.fullmatch(part)
+        if match is None:
+            raise ValueError(f"Invalid IMOD range entry: {part!r}")
+        start, end = match.groups()
+        out.extend(range(int(start), int(end or start) + 1))
 
     return out
 
@@ -81,67 +112,49 @@ class ImodTILTCOM(FileIOBase):
 
     @classmethod
     def from_string(cls, text: str):
-        patterns = {
-            "InputProjections": (r"^InputProjections\s+(.+)$", (1,)),
-            "OutputFile": (r"^OutputFile\s+(.+)$", (1,)),
-            "IMAGEBINNED": (r"^IMAGEBINNED\s+(\d+)$", (1,)),
-            "TILTFILE": (r"^TILTFILE\s+(.+)$", (1,)),
-            "THICKNESS": (r"^THICKNESS\s+([\d.]+)$", (1,)),
-            "RADIAL": (r"^RADIAL\s+([\d.]+)\s+([\d.]+)$", (1, 2)),
-            "FalloffIsTrueSigma": (r"^FalloffIsTrueSigma\s+(\d+)$", (1,)),
-            "XAXISTILT": (r"^XAXISTILT\s+([\d.]+)$", (1,)),
-            "SCALE": (r"^SCALE\s+([\d.]+)\s+([\d.]+)$", (1, 2)),
-            "PERPENDICULAR": (r"^PERPENDICULAR.*$", ()),
-            "MODE": (r"^MODE\s+(\d+)$", (1,)),
-            "FULLIMAGE": (r"^FULLIMAGE\s+(\d+)\s+(\d+)$", (1, 2)),
-            "SUBSETSTART": (r"^SUBSETSTART\s+([-\d]+)\s+([-\d]+)$", (1, 2)),
-            "AdjustOrigin": (r"^AdjustOrigin.*$", ()),
-            "ActionIfGPUFails": (r"^ActionIfGPUFails\s+(\d+),(\d+)$", (1, 2)),
-            "XTILTFILE": (r"^XTILTFILE\s+(.+)$", (1,)),
-            "OFFSET": (r"^OFFSET\s+(-?[\d.]+)$", (1,)),
-            "SHIFT": (r"^SHIFT\s+(-?[\d.]+)\s+(-?[\d.]+)$", (1, 2)),
-            "EXCLUDELIST2": (r"^(EXCLUDELIST2|EXCLUDELIST|EXCLUDE)\s+(.+)$", (2,)),
-        }
-
-        params = {}
-        for key, (pattern, groups) in patterns.items():
-            match = re.search(pattern, text, re.M)
+        params = dict.fromkeys(_PATTERNS)
+
+        # Single pass, the first matching line of each key wins
+        for line in text.splitlines():
+            tokens = line.split(None, 1)
+            key = _KEY_BY_TOKEN.get(tokens[0] if tokens else "")
+            if key is None or params[key] is not None:
+                continue
+            pattern, groups = _PATTERNS[key]
+            match = pattern.match(line)
             if match:
-                if groups:
-                    if key == "EXCLUDELIST2":
-                        params[key] = imod_range_to_list(match.group(*groups))
-                    else:
-                        params[key] = match.group(*groups)
-                else:
+                if not groups:
                     params[key] = True
-            else:
-                params[key] = None
+                elif key == "EXCLUDELIST2":
+                    params[key] = imod_range_to_list(match.group(*groups))
+                else:
+                    params[key] = match.group(*groups)
 
         return cls(**params)
 
     def __str__(self):
-        outputs = "$setenv IMOD_OUTPUT_FORMAT MRC\n$tilt -StandardInput\n"
-        outputs += f"InputProjections {self.InputProjections}\n"
-        outputs += f"OutputFile {self.OutputFile}\n"
-        outputs += f"IMAGEBINNED {self.IMAGEBINNED}\n"
-        outputs += f"TILTFILE {self.TILTFILE}\n"
-        outputs += f"THICKNESS {self.THICKNESS}\n"
-        outputs += f"RADIAL {self.RADIAL[0]:.2f} {self.RADIAL[1]:.3f}\n"
-        outputs += f"FalloffIsTrueSigma {self.FalloffIsTrueSigma}\n"
-        outputs += f"XAXISTILT {self.XAXISTILT}\n"
-        outputs += f"SCALE {self.SCALE[0]:.1f} {self.SCALE[1]:.1f}\n"
+        outputs = ["$setenv IMOD_OUTPUT_FORMAT MRC\n$tilt -StandardInput\n"]
+        outputs.append(f"InputProjections {self.InputProjections}\n")
+        outputs.append(f"OutputFile {self.OutputFile}\n")
+        outputs.append(f"IMAGEBINNED {self.IMAGEBINNED}\n")
+        outputs.append(f"TILTFILE {self.TILTFILE}\n")
+        outputs.append(f"THICKNESS {self.THICKNESS}\n")
+        outputs.append(f"RADIAL {self.RADIAL[0]:.2f} {self.RADIAL[1]:.3f}\n")
+        outputs.append(f"FalloffIsTrueSigma {self.FalloffIsTrueSigma}\n")
+        outputs.append(f"XAXISTILT {self.XAXISTILT}\n")
+        outputs.append(f"SCALE {self.SCALE[0]:.1f} {self.SCALE[1]:.1f}\n")
         if self.PERPENDICULAR:
-            outputs += "PERPENDICULAR\n"
-        outputs += f"MODE {self.MODE}\n"
-        outputs += f"FULLIMAGE {self.FULLIMAGE[0]} {self.FULLIMAGE[1]}\n"
-        outputs += f"SUBSETSTART {self.SUBSETSTART[0]} {self.SUBSETSTART[1]}\n"
+            outputs.append("PERPENDICULAR\n")
+        outputs.append(f"MODE {self.MODE}\n")
+        outputs.append(f"FULLIMAGE {self.FULLIMAGE[0]} {self.FULLIMAGE[1]}\n")
+        outputs.append(f"SUBSETSTART {self.SUBSETSTART[0]} {self.SUBSETSTART[1]}\n")
         if self.AdjustOrigin:
-            outputs += "AdjustOrigin\n"
-        outputs += f"ActionIfGPUFails {self.ActionIfGPUFails[0]},{self.ActionIfGPUFails[1]}\n"
-        outputs += f"XTILTFILE {self.XTILTFILE}\n"
-        outputs += f"OFFSET {self.OFFSET}\n"
-        outputs += f"SHIFT {self.SHIFT[0]} {self.SHIFT[1]}\n"
+            outputs.append("AdjustOrigin\n")
+        outputs.append(f"ActionIfGPUFails {self.ActionIfGPUFails[0]},{self.ActionIfGPUFails[1]}\n")
+        outputs.append(f"XTILTFILE {self.XTILTFILE}\n")
+        outputs.append(f"OFFSET {self.OFFSET}\n")
+        outputs.append(f"SHIFT {self.SHIFT[0]} {self.SHIFT[1]}\n")
         if self.EXCLUDELIST2:
-            outputs += f"EXCLUDELIST2 {','.join(map(str, self.EXCLUDELIST2))}\n"
-        outputs += "$if (-e ./savework) ./savework\n"
-        return outputs
+            outputs.append(f"EXCLUDELIST2 {','.join(map(str, self.EXCLUDELIST2))}\n")
+        outputs.append("$if (-e ./savework) ./savework\n")
+        return "".join(outputs)
@@ -1,13 +1,20 @@
-from typing import List, Union
+import io
+import itertools
+from typing import TYPE_CHECKING, List, NamedTuple, Union
 
 import numpy as np
-import pandas as pd
-import pydantic
 
 from cryoet_alignment.io.base import FileIOBase
+from cryoet_alignment.util.dataframe import is_dataframe
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-class ImodXFInfo(pydantic.BaseModel):
+# Fixed-width row format of the .xf file
+_XF_FMT = "%12.7f%12.7f%12.7f%12.7f%12.3f%12.3f"
+
+
+class ImodXFInfo(NamedTuple):
     mxx: float
     mxy: float
     myx: float
@@ -17,27 +24,10 @@ class ImodXFInfo(pydantic.BaseModel):
 
     @classmethod
     def from_string(cls, line: str) -> "ImodXFInfo":
-        values = line.split()
-        mxx = float(values[0])
-        mxy = float(values[1])
-        myx = float(values[2])
-        myy = float(values[3])
-        sx = float(values[4])
-        sy = float(values[5])
-        return cls(mxx=mxx, mxy=mxy, myx=myx, myy=myy, sx=sx, sy=sy)
+        return cls._make(map(float, line.split()[:6]))
 
     def __str__(self) -> str:
-        return (
-            f"{self.mxx:>12.7f}"
-            f"{self.mxy:>12.7f}"
-            f"{self.myx:>12.7f}"
-            f"{self.myy:>12.7f}"
-            f"{self.sx:>12.3f}"
-            f"{self.sy:>12.3f}"
-        )
-
-    def __iter__(self):
-        return iter([self.mxx, self.mxy, self.myx, self.myy, self.sx, self.sy])
+        return _XF_FMT % self
 
     def rot_matrix(self) -> np.ndarray:
         return np.array([[self.mxx, self.mxy], [self.myx, self.myy]])
@@ -51,24 +41,31 @@ class ImodXF(FileIOBase):
 
     @classmethod
     def from_string(cls, text: str) -> "ImodXF":
-        lines = text.strip().split("\n")
-        alignments = [ImodXFInfo.from_string(line) for line in lines]
-        return cls(alignments=alignments)
+        rows = np.loadtxt(io.StringIO(text), dtype=np.float64, usecols=range(6), ndmin=2).tolist()
+        # Values are already floats, skip validation
+        return cls.model_construct(alignments=list(map(ImodXFInfo._make, rows)))
 
     def __str__(self):
-        return "\n".join(str(alignment) for alignment in self.alignments) + "\n"
+        # One format call for the whole table
+        values = itertools.chain.from_iterable(self.alignments)
+        return "\n".join([_XF_FMT] * len(self.alignments)) % tuple(values) + "\n"
 
     def numpy(self) -> np.ndarray:
-        return np.array([list(a) for a in self.alignments])
+        return np.array(self.alignments, dtype=np.float64).reshape(-1, 6)
 
-    def pandas(self) -> pd.DataFrame:
-        return pd.DataFrame([a.model_dump() for a in self.alignments])
+    def pandas(self) -> "pd.DataFrame":
+        import pandas as pd
 
-    def set(self, values: Union[np.ndarray, pd.DataFrame]):
+        return pd.DataFrame(self.numpy(), columns=ImodXFInfo._fields)
+
+    def set(self, values: Union[np.ndarray, "pd.DataFrame"]):
+        fields = list(ImodXFInfo._fields)
         if isinstance(values, np.ndarray):
             assert values.shape[1] == 6, "Global alignment must have 6 columns."
-            self.alignments = [ImodXFInfo(**dict(zip(values.dtype.names, row))) for row in values]
-        elif isinstance(values, pd.DataFrame):
-            self.alignments = [ImodXFInfo(**row) for _, row in values.iterrows()]
+            rows = values.astype(np.float64).tolist()
+        elif is_dataframe(values):
+            rows = values[fields].to_numpy(dtype=np.float64).tolist()
         else:
             raise ValueError("Invalid value type. Must be numpy.ndarray or pandas.DataFrame")
+
+        self.alignments = list(map(ImodXFInfo._make, rows))
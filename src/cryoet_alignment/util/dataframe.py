@@ -0,0 +1,17 @@
+import sys
+from typing import Any
+
+
+def is_dataframe(obj: Any) -> bool:
+    """Check whether an object is a pandas DataFrame, without importing pandas.
+
+    If pandas has not been imported yet, the object cannot be a DataFrame.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        bool: True if the object is a pandas DataFrame.
+    """
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, pd.DataFrame)
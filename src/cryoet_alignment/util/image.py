@@ -1,15 +1,31 @@
+import functools
+import os
 from typing import Tuple
 
 from mrcfile.mrcinterpreter import MrcInterpreter
 
 
-def get_ts_size_local(file: str) -> Tuple[int, int, int]:
+@functools.lru_cache(maxsize=256)
+def _read_mrc_header(file: str, mtime_ns: int, size: int, inode: int):
+    # The stat fields are only part of the cache key, a modified or replaced file is read again
     with open(file, "rb") as f:
         mrc = MrcInterpreter(f, header_only=True)
-        return mrc.header.nx, mrc.header.ny, mrc.header.nz
+        return mrc.header
+
+
+def get_ts_size_local(file: str) -> Tuple[int, int, int]:
+    header = get_mrc_header_local(file)
+    return header.nx, header.ny, header.nz
 
 
 def get_mrc_header_local(file: str):
-    with open(file, "rb") as f:
-        mrc = MrcInterpreter(f, header_only=True)
-        return mrc.header
+    """Read the header of a local MRC file. Headers are cached per absolute path, modification time, size and inode."""
+    file = os.path.abspath(os.fsdecode(file))
+    stat = os.stat(file)
+    # Copy, so callers can't modify the cached header
+    return _read_mrc_header(file, stat.st_mtime_ns, stat.st_size, stat.st_ino).copy()
+
+
+def clear_mrc_header_cache() -> None:
+    """Clear the cache of `get_mrc_header_local`."""
+    _read_mrc_header.cache_clear()
@@ -1,7 +1,11 @@
+import math
+from pathlib import Path
+from typing import Callable
+
 from cryoet_alignment.io.cryoet_data_portal.alignment import Alignment
 
 
-def test_imod_consistency(imod_base: str):
+def test_imod_consistency(imod_base: str, read_text: Callable[[Path], str]):
     path = imod_base
 
     ali = Alignment.from_imod_basename(path)
@@ -10,11 +14,18 @@ def test_imod_consistency(imod_base: str):
     tlt = imod_alignment.tlt
     xtilt = imod_alignment.xtilt
 
-    with open(f"{path}.xf", "r") as f:
-        assert f.read() == str(xf), "XF serialization does not match."
+    assert read_text(Path(f"{path}.xf")) == str(xf), "XF serialization does not match."
+    assert read_text(Path(f"{path}.tlt")) == str(tlt), "TLT serialization does not match."
+    assert read_text(Path(f"{path}.xtilt")) == str(xtilt), "XTILT serialization does not match."
+
+
+def test_json_roundtrip(imod_base: str):
+    ali = Alignment.from_imod_basename(imod_base)
+    ali.tilt_offset = float("inf")
+    ali.per_section_alignment_parameters[0].x_offset = float("nan")
 
-    with open(f"{path}.tlt", "r") as f:
-        assert f.read() == str(tlt), "TLT serialization does not match."
+    res = Alignment.from_string(str(ali))
 
-    with open(f"{path}.xtilt", "r") as f:
-        assert f.read() == str(xtilt), "XTILT serialization does not match."
+    assert math.isinf(res.tilt_offset), "inf was not kept."
+    assert math.isnan(res.per_section_alignment_parameters[0].x_offset), "NaN was not kept."
+    assert str(res) == str(ali), "Round trip does not match."
@@ -0,0 +1,40 @@
+import filecmp
+from pathlib import Path
+
+import pytest
+
+from cryoet_alignment import read_many, write_many
+from cryoet_alignment.io.aretomo3.aln import AreTomo3ALN
+from cryoet_alignment.io.imod import ImodAlignment
+
+
+def test_read_write_many(aln_file, imod_base: str, tmp_path: Path):
+    aln, imod = read_many([aln_file.path, imod_base], max_workers=2)
+
+    assert isinstance(aln, AreTomo3ALN)
+    assert isinstance(imod, ImodAlignment)
+    assert aln == aln_file.model
+
+    imod_out = tmp_path / "imod"
+    imod_out.mkdir()
+    write_many([(aln, tmp_path / aln_file.path.name), (imod, imod_out / "tilt_1")], max_workers=2)
+
+    assert filecmp.cmp(tmp_path / aln_file.path.name, aln_file.path, shallow=False), "Written ALN does not match."
+    for ext in ("xf", "tlt", "xtilt"):
+        assert filecmp.cmp(imod_out / f"tilt_1.{ext}", f"{imod_base}.{ext}", shallow=False), f"Written {ext} differs."
+    assert read_many([imod_out / "tilt_1"], reader="imod") == [imod]
+
+
+def test_read_write_many_empty():
+    assert read_many([]) == []
+    write_many([])
+
+
+def test_read_many_error(aln_file, tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        read_many([aln_file.path, tmp_path / "missing.aln"])
+
+
+def test_write_many_error(aln_file, tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        write_many([(aln_file.model, tmp_path / "missing" / "test.aln")])
@@ -1,16 +1,127 @@
+import filecmp
 from pathlib import Path
-from typing import Tuple
 
-from cryoet_alignment.io.aretomo3.aln import AreTomo3ALN
+import numpy as np
+import pytest
 
+from cryoet_alignment.io.aretomo3.aln import AreTomo3ALN, GlobalAlignmentInfo, LocalAlignmentInfo
+from cryoet_alignment.io.base import _MMAP_MIN_SIZE
 
-def test_aln(aln_file: Tuple[Path, AreTomo3ALN]):
-    path, exp = aln_file
 
-    aln = AreTomo3ALN.from_file(path)
+def test_aln(aln_file, tmp_path: Path):
+    aln = AreTomo3ALN.from_file(aln_file.path)
 
-    for key in exp.model_fields:
-        assert getattr(aln, key) == getattr(exp, key), f"Field {key} does not match."
+    assert aln == aln_file.model, "Parsed model does not match."
 
-    with open(path, "r") as f:
-        assert str(aln) == f.read(), "Serialization does not match."
+    assert str(aln) == aln_file.raw, "Serialization does not match."
+
+    out = tmp_path / aln_file.path.name
+    aln.to_file(out)
+    assert filecmp.cmp(out, aln_file.path, shallow=False), "Written file does not match."
+
+
+@pytest.mark.parametrize("kind", ["numpy", "pandas"])
+def test_aln_get_set_alignments(aln_file, kind: str):
+    aln = AreTomo3ALN.from_file(aln_file.path)
+
+    global_alignments = aln.get_global_alignments(kind)
+    local_alignments = aln.get_local_alignments(kind)
+    assert len(global_alignments) == len(aln_file.model.GlobalAlignments)
+    assert len(local_alignments) == len(aln_file.model.LocalAlignments)
+
+    copy = aln.model_copy()
+    copy.set_global_alignments(global_alignments)
+    copy.set_local_alignments(local_alignments)
+    assert copy == aln_file.model
+    assert str(copy) == aln_file.raw
+
+
+def test_aln_set_alignments_invalid_shape(aln_file):
+    aln = AreTomo3ALN.from_file(aln_file.path)
+
+    with pytest.raises(ValueError):
+        aln.GlobalAlignments = np.zeros((5, 4))
+    with pytest.raises(ValueError):
+        aln.LocalAlignments = np.zeros(7)
+    with pytest.raises(ValueError):
+        AreTomo3ALN(**aln_file.model.model_dump(exclude={"GlobalAlignments"}), GlobalAlignments=np.zeros((2, 9)))
+
+    assert aln == aln_file.model, "Failed assignments must not modify the alignment."
+
+
+def test_aln_set_alignment_models(aln_file):
+    aln = AreTomo3ALN.from_file(aln_file.path)
+
+    global_alignments = [g.model_copy(update={"tx": g.tx + 1.0}) for g in aln.GlobalAlignments]
+    aln.GlobalAlignments = global_alignments
+    aln.LocalAlignments = [LocalAlignmentInfo(**local.model_dump()) for local in aln_file.model.LocalAlignments[:2]]
+
+    assert aln.GlobalAlignments == global_alignments
+    assert all(isinstance(g, GlobalAlignmentInfo) for g in aln.GlobalAlignments)
+    assert aln.LocalAlignments == aln_file.model.LocalAlignments[:2]
+
+
+def test_aln_load_locals(aln_file):
+    lazy = AreTomo3ALN.from_file(aln_file.path)
+    eager = AreTomo3ALN.from_file(aln_file.path, load_locals=True)
+
+    assert lazy._local_block is not None
+    assert eager._local_block is None
+
+    assert lazy.LocalAlignments == eager.LocalAlignments == aln_file.model.LocalAlignments
+    assert lazy._local_block is None
+    assert lazy == eager
+
+
+def test_aln_large_file(aln_file, tmp_path: Path):
+    # Large enough to be memory-mapped when read
+    aln = aln_file.model.model_copy()
+    local_alignments = aln_file.model.get_local_alignments()
+    aln.set_local_alignments(np.tile(local_alignments, (_MMAP_MIN_SIZE // 300 + 1, 1)))
+
+    out = tmp_path / aln_file.path.name
+    aln.to_file(out)
+    assert out.stat().st_size >= _MMAP_MIN_SIZE
+
+    # Locals are parsed lazily, after the mapping is closed
+    large = AreTomo3ALN.from_file(out)
+    assert large == aln
+    assert str(large) == out.read_text()
+
+
+def test_aln_set_structured_alignments(aln_file):
+    aln = AreTomo3ALN.from_file(aln_file.path)
+    records = aln._globals.copy()
+
+    # Fields are matched by name, not by position
+    reordered = records[list(reversed(records.dtype.names))]
+    aln.GlobalAlignments = np.array(reordered, dtype=[(name, "f8") for name in reordered.dtype.names])
+    assert aln == aln_file.model
+
+    # The stored alignment does not alias the assigned array
+    aln.GlobalAlignments = records
+    records["tx"] += 1.0
+    assert aln == aln_file.model
+
+
+def test_aln_set_fractional_index(aln_file):
+    aln = AreTomo3ALN.from_file(aln_file.path)
+    global_alignments = aln.get_global_alignments()
+    local_alignments = aln.get_local_alignments()
+    global_alignments[0, 0] = 1.5
+    local_alignments[0, 1] = np.nan
+
+    with pytest.raises(ValueError):
+        aln.set_global_alignments(global_alignments)
+    with pytest.raises(ValueError):
+        aln.set_local_alignments(local_alignments)
+
+
+def test_aln_pandas_dtypes(aln_file):
+    global_alignments, local_alignments = aln_file.model.pandas()
+
+    assert global_alignments["sec"].dtype == np.int64
+    assert local_alignments["sec_idx"].dtype == np.int64
+    assert local_alignments["patch_idx"].dtype == np.int64
+    assert (global_alignments.drop(columns="sec").dtypes == np.float64).all()
+    assert (local_alignments.drop(columns=["sec_idx", "patch_idx"]).dtypes == np.float64).all()
@@ -0,0 +1,80 @@
+import fsspec
+import pytest
+
+from cryoet_alignment.io import base
+from cryoet_alignment.io.aretomo3.aln import AreTomo3ALN
+from cryoet_alignment.io.imod.rawtlt import ImodRAWTLT
+from cryoet_alignment.io.imod.xf import ImodXF
+
+
+@pytest.fixture
+def memory_fs(request: pytest.FixtureRequest):
+    fs = fsspec.filesystem("memory")
+    root = f"/{request.node.name}"
+    yield fs, root
+    if fs.exists(root):
+        fs.rm(root, recursive=True)
+
+
+def test_from_fs_many(memory_fs, rawtlt_file, xf_file):
+    fs, root = memory_fs
+    # Glob characters in a key must be read literally
+    paths = [f"memory://{root}/tilt[1]*.rawtlt", f"{root}/tilt?.rawtlt"]
+    fs.pipe(paths[0], rawtlt_file.raw.encode())
+    fs.pipe(paths[1], str(ImodRAWTLT(angles=[1.0, 2.0])).encode())
+    fs.pipe(f"{root}/tilt1x.rawtlt", xf_file.raw.encode())
+
+    res = ImodRAWTLT.from_fs_many("memory", paths)
+
+    assert res == [rawtlt_file.model, ImodRAWTLT(angles=[1.0, 2.0])]
+    assert ImodRAWTLT.from_fs_many("memory", []) == []
+
+
+def test_from_fs_many_missing(memory_fs):
+    _, root = memory_fs
+
+    with pytest.raises(FileNotFoundError):
+        ImodXF.from_fs_many("memory", [f"{root}/missing.xf"])
+
+
+def test_from_s3_many(memory_fs, monkeypatch: pytest.MonkeyPatch, xf_file):
+    fs, root = memory_fs
+    fs.pipe(f"{root}/test.xf", xf_file.raw.encode())
+
+    calls = []
+
+    def filesystem(protocol, kwargs):
+        calls.append((protocol, kwargs))
+        return fs
+
+    monkeypatch.setattr(base, "_filesystem", filesystem)
+
+    assert ImodXF.from_s3_many([f"{root}/test.xf"], anon=True) == [xf_file.model]
+    assert calls == [("s3", {"anon": True})]
+
+
+def test_from_fs_parser_kwargs(memory_fs, aln_file):
+    fs, root = memory_fs
+    path = f"{root}/test.aln"
+    fs.pipe(path, aln_file.raw.encode())
+
+    lazy = AreTomo3ALN.from_fs("memory", path)
+    assert lazy._local_block is not None
+
+    eager = AreTomo3ALN.from_fs("memory", path, parser_kwargs={"load_locals": True})
+    assert eager._local_block is None
+    assert eager == aln_file.model
+
+    (many,) = AreTomo3ALN.from_fs_many("memory", [path], parser_kwargs={"load_locals": True})
+    assert many._local_block is None
+    assert many == aln_file.model
+
+
+def test_from_s3_parser_kwargs(memory_fs, monkeypatch: pytest.MonkeyPatch, aln_file):
+    fs, root = memory_fs
+    fs.pipe(f"{root}/test.aln", aln_file.raw.encode())
+    monkeypatch.setattr(base, "_filesystem", lambda protocol, kwargs: fs)
+
+    aln = AreTomo3ALN.from_s3(f"{root}/test.aln", parser_kwargs={"load_locals": True}, anon=True)
+    assert aln._local_block is None
+    assert aln == aln_file.model
@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+
+import mrcfile
+import numpy as np
+
+from cryoet_alignment.util.image import clear_mrc_header_cache, get_ts_size_local
+
+
+def _write_mrc(path: Path, shape) -> None:
+    with mrcfile.new(path, overwrite=True) as mrc:
+        mrc.set_data(np.zeros(shape, dtype=np.float32))
+
+
+def test_mrc_header_cache(tmp_path: Path, monkeypatch):
+    path = tmp_path / "ts.mrc"
+    _write_mrc(path, (3, 4, 5))
+    stat = path.stat()
+    assert get_ts_size_local(str(path)) == (5, 4, 3)
+
+    # Rewritten within the same timestamp tick
+    _write_mrc(path, (2, 4, 5))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert get_ts_size_local(str(path)) == (5, 4, 2)
+
+    # Same relative path, different directory
+    other = tmp_path / "other"
+    other.mkdir()
+    _write_mrc(other / "ts.mrc", (1, 4, 5))
+    os.utime(other / "ts.mrc", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    monkeypatch.chdir(tmp_path)
+    assert get_ts_size_local("ts.mrc") == (5, 4, 2)
+    monkeypatch.chdir(other)
+    assert get_ts_size_local("ts.mrc") == (5, 4, 1)
+
+    clear_mrc_header_cache()
+    assert get_ts_size_local("ts.mrc") == (5, 4, 1)
@@ -1,55 +1,70 @@
+import filecmp
 from pathlib import Path
-from typing import Tuple
+from typing import Type
 
+import pytest
+
+from cryoet_alignment.io.base import FileIOBase
 from cryoet_alignment.io.imod.newst import ImodNEWSTCOM
 from cryoet_alignment.io.imod.rawtlt import ImodRAWTLT
-from cryoet_alignment.io.imod.tilt import ImodTILTCOM
+from cryoet_alignment.io.imod.tilt import ImodTILTCOM, imod_range_to_list
 from cryoet_alignment.io.imod.xf import ImodXF
 
 
-def test_newst(newstcom_file: Tuple[Path, ImodNEWSTCOM]):
-    path, exp = newstcom_file
-
-    newst = ImodNEWSTCOM.from_file(path)
-
-    for key in exp.model_fields:
-        assert getattr(newst, key) == getattr(exp, key), f"Field {key} does not match."
-
-    with open(path, "r") as f:
-        assert str(newst) == f.read(), "Serialization does not match."
-
-
-def test_rawtlt(rawtlt_file: Tuple[Path, ImodRAWTLT]):
-    path, exp = rawtlt_file
+@pytest.mark.parametrize(
+    "fixture_name,cls",
+    [
+        ("newstcom_file", ImodNEWSTCOM),
+        ("rawtlt_file", ImodRAWTLT),
+        ("tiltcom_file", ImodTILTCOM),
+        ("xf_file", ImodXF),
+    ],
+)
+def test_io_roundtrip(request: pytest.FixtureRequest, tmp_path: Path, fixture_name: str, cls: Type[FileIOBase]):
+    fixture = request.getfixturevalue(fixture_name)
 
-    rawtlt = ImodRAWTLT.from_file(path)
+    obj = cls.from_file(fixture.path)
 
-    for key in exp.model_fields:
-        assert getattr(rawtlt, key) == getattr(exp, key), f"Field {key} does not match."
+    assert obj == fixture.model, "Parsed model does not match."
+    assert str(obj) == fixture.raw, "Serialization does not match."
 
-    with open(path, "r") as f:
-        assert str(rawtlt) == f.read(), "Serialization does not match."
+    out = tmp_path / fixture.path.name
+    obj.to_file(out)
+    assert filecmp.cmp(out, fixture.path, shallow=False), "Written file does not match."
 
 
-def test_tilt(tiltcom_file: Tuple[Path, ImodTILTCOM]):
-    path, exp = tiltcom_file
+def test_imod_range_to_list():
+    assert imod_range_to_list("1,2-6,8,10-12") == [1, 2, 3, 4, 5, 6, 8, 10, 11, 12]
+    assert imod_range_to_list("5") == [5]
+    assert imod_range_to_list("") == []
+    assert imod_range_to_list(None) == []
+    assert imod_range_to_list("1 - 3, 5") == [1, 2, 3, 5]
 
-    tilt = ImodTILTCOM.from_file(path)
+    for text in ("1.5", "3-x", "1,,2", "1-2-3"):
+        with pytest.raises(ValueError):
+            imod_range_to_list(text)
 
-    for key in exp.model_fields:
-        assert getattr(tilt, key) == getattr(exp, key), f"Field {key} does not match."
 
-    with open(path, "r") as f:
-        assert str(tilt) == f.read(), "Serialization does not match."
+@pytest.mark.parametrize(
+    "fixture_name,cls",
+    [
+        ("newstcom_file", ImodNEWSTCOM),
+        ("tiltcom_file", ImodTILTCOM),
+    ],
+)
+def test_com_whitespace_lines(request: pytest.FixtureRequest, fixture_name: str, cls: Type[FileIOBase]):
+    fixture = request.getfixturevalue(fixture_name)
 
+    lines = fixture.raw.splitlines()
+    lines.insert(2, "  ")
+    lines.append("\t")
 
-def test_xf(xf_file: Tuple[Path, ImodXF]):
-    path, exp = xf_file
+    assert cls.from_string("\n".join(lines)) == fixture.model
 
-    xf = ImodXF.from_file(path)
 
-    for key in exp.model_fields:
-        assert getattr(xf, key) == getattr(exp, key), f"Field {key} does not match."
+def test_rawtlt_from_string():
+    assert ImodRAWTLT.from_string("") == ImodRAWTLT(angles=[])
+    assert ImodRAWTLT.from_string("-1.5\n 2\n") == ImodRAWTLT(angles=[-1.5, 2.0])
 
-    with open(path, "r") as f:
-        assert f.read() == str(xf), "Serialization does not match."
+    with pytest.raises(ValueError):
+        ImodRAWTLT.from_string("1.0\nx\n")